@@ -4,7 +4,10 @@ import discord
 import os
 import random
 import asyncio
+import time
+import functools
 from random import randint
+from bisect import bisect_right
 import datetime
 from datetime import date, timedelta
 from discord import app_commands, AllowedMentions
@@ -12,7 +15,7 @@ from discord.ext import commands, tasks
 from dotenv import load_dotenv
 from songs import songs_in_range, random_song, random_seat
 from back import paulback
-from ticketjam import TicketDatabase, mark_tickets_as_posted, TicketJamScraper
+from ticketjam import TicketJamScraper
 
 load_dotenv()
 TOKEN = os.getenv('DISCORD_TOKEN')
@@ -27,31 +30,64 @@ GUILD_ID = discord.Object(id=1295405688616652884)
 intents = discord.Intents.default()
 intents.message_content = True
 
-random.seed()
+rng = random.Random()
+UNWILLING_CHANCE = 1 / 200
 bot = commands.Bot(command_prefix='/', intents=intents)
 
 async def unwilling_to_speak(ctx):
-    if random.randint(0, 199) == 0:
+    if rng.random() < UNWILLING_CHANCE:
         await ctx.send("我現在不想和你說話😾😾")
         return 1
     return 0
 
+@functools.lru_cache(maxsize=1)
+def date_of_minute(minute):
+    return date.today()
+
+def current_date():
+    """date.today(), computed at most once per wall-clock minute"""
+    return date_of_minute(int(time.time() // 60))
+
 def songs_to_msg(songs):
     return f'```{"\n".join(map(str, songs))}```'
 
-def format_ticket_for_discord(ticket):
-    """Format a ticket for Discord posting with price change information"""
-    # Use TicketDatabase to get enhanced ticket info with price changes
-    db = TicketDatabase()
-    enhanced_ticket = db.get_ticket_with_price_info(ticket)
-
-    # Map color hints to Discord colors
-    color_map = {
-        'default': 0x00ff00,    # Green
-        'increase': 0xff6b6b,   # Red for price increase
-        'decrease': 0x51cf66    # Bright green for price decrease
-    }
-    color = color_map.get(enhanced_ticket['color_hint'], 0x00ff00)
+ticket_scraper = None
+
+def get_scraper():
+    """Return the shared TicketJamScraper, creating it on first use
+
+    Reusing one scraper keeps its requests.Session (and the TCP/TLS
+    connections in its pool) alive between scrape cycles.
+    """
+    global ticket_scraper
+    if ticket_scraper is None:
+        ticket_scraper = TicketJamScraper()
+    return ticket_scraper
+
+def get_ticket_db():
+    """Return the shared TicketDatabase, i.e. the one the scraper writes to"""
+    return get_scraper().db
+
+# Map color hints to Discord colors
+TICKET_COLORS = {
+    'default': 0x00ff00,    # Green
+    'increase': 0xff6b6b,   # Red for price increase
+    'decrease': 0x51cf66    # Bright green for price decrease
+}
+
+# Optional ticket fields shown inline on the embed, in display order
+TICKET_FIELDS = (
+    ('date', "📅 日付"),
+    ('time', "🕐 時間"),
+    ('venue', "🏢 会場"),
+    ('location', "📍 場所"),
+    ('seat_info', "💺 座席"),
+    ('days_remaining', "⏰ 残り"),
+)
+
+def format_ticket_for_discord(ticket, enhanced_ticket):
+    """Format a ticket and its precomputed price change information for Discord posting"""
+    color = TICKET_COLORS.get(enhanced_ticket['color_hint'], 0x00ff00)
 
     embed = discord.Embed(
         title=f"🎫 {ticket['event_name'][:100]}",
@@ -61,18 +97,9 @@ def format_ticket_for_discord(ticket):
     )
 
     # Add fields
-    if ticket['date']:
-        embed.add_field(name="📅 日付", value=ticket['date'], inline=True)
-    if ticket['time']:
-        embed.add_field(name="🕐 時間", value=ticket['time'], inline=True)
-    if ticket['venue']:
-        embed.add_field(name="🏢 会場", value=ticket['venue'], inline=True)
-    if ticket['location']:
-        embed.add_field(name="📍 場所", value=ticket['location'], inline=True)
-    if ticket['seat_info']:
-        embed.add_field(name="💺 座席", value=ticket['seat_info'], inline=True)
-    if ticket['days_remaining']:
-        embed.add_field(name="⏰ 残り", value=ticket['days_remaining'], inline=True)
+    for key, name in TICKET_FIELDS:
+        if value := ticket[key]:
+            embed.add_field(name=name, value=value, inline=True)
 
     # Add instant buy indicator
     if ticket['is_instant_buy']:
@@ -97,41 +124,38 @@ def format_ticket_for_discord(ticket):
 
     return embed
 
-async def post_tickets():
-    """Post all unposted tickets to the Discord channel"""
+async def post_unposted(channel_id):
+    """Post all unposted tickets to the Discord channel with the given ID"""
     try:
-        db = TicketDatabase()
+        db = get_ticket_db()
         unposted_tickets = db.get_unposted_tickets('active')  # Only active tickets
 
         if not unposted_tickets:
             return {"status": "success", "message": "No unposted tickets found", "count": 0}
 
-        channel = bot.get_channel(TICKET_CHANNEL)
+        channel = bot.get_channel(channel_id)
         if not channel:
-            print(f"Could not find channel with ID {TICKET_CHANNEL}")
-            return {"status": "error", "message": f"Could not find channel with ID {TICKET_CHANNEL}"}
+            print(f"Could not find channel with ID {channel_id}")
+            return {"status": "error", "message": f"Could not find channel with ID {channel_id}"}
 
-        posted_count = 0
-        ticket_ids_to_mark = []
+        enhanced_tickets = db.get_tickets_with_price_info_bulk(unposted_tickets)
 
-        # Post each ticket
+        # Post each ticket, one after another so they appear in order.
+        # discord.py paces the sends against Discord's rate limits, so no
+        # delay is needed between them
+        ticket_ids_to_mark = []
         for ticket in unposted_tickets:
             try:
-                embed = format_ticket_for_discord(ticket)
+                embed = format_ticket_for_discord(ticket, enhanced_tickets[ticket['ticket_id']])
                 await channel.send(embed=embed)
                 ticket_ids_to_mark.append(ticket['ticket_id'])
-                posted_count += 1
-
-                # Add small delay to avoid rate limiting
-                await asyncio.sleep(1)
-
             except Exception as e:
                 print(f"Error posting ticket {ticket['ticket_id']}: {e}")
-                continue
+        posted_count = len(ticket_ids_to_mark)
 
         # Mark posted tickets as posted
         if ticket_ids_to_mark:
-            mark_tickets_as_posted(ticket_ids_to_mark)
+            db.mark_tickets_as_posted(ticket_ids_to_mark)
             print(f"Successfully posted {posted_count} tickets and marked them as posted")
 
         return {
@@ -142,54 +166,52 @@ async def post_tickets():
         }
 
     except Exception as e:
-        print(f"Error in post_tickets: {e}")
+        print(f"Error posting unposted tickets: {e}")
         return {"status": "error", "message": str(e)}
 
+async def post_tickets():
+    """Post all unposted tickets to the ticket channel"""
+    return await post_unposted(TICKET_CHANNEL)
+
+async def post_unposted_tickets():
+    """Post all unposted tickets to the main channel"""
+    return await post_unposted(CHANNEL)
+
 TRIGGER_TIME = datetime.time(hour=1, minute=0, tzinfo=datetime.timezone.utc)
 @tasks.loop(time=TRIGGER_TIME)
 async def post_anniv():
     """Post anniversary songs on 9AM UTC+8 every day"""
-    songs = songs_in_range(date.today(), date.today() + timedelta(days=1))
-    if not any(songs):
+    t = current_date()
+    songs = songs_in_range(t, t + timedelta(days=1))
+    if not songs:
         return
 
     channel = bot.get_channel(BIRTHDAY_CHANNEL)
-    try:
-        for song in songs:
-            year = date.today().year - song.year
-            string = f"今天是**{song.name}**的 {year} 歲生日，生日快樂 :tada: :tada:！\n{song.url}"
-            await channel.send(string)
-
-            # Add small delay to avoid rate limiting
-            await asyncio.sleep(1)
-    except Exception as e:
-        print(f"Error in post_anniv: {e}")
+    # In order, one after another; discord.py handles the rate limiting
+    for song in songs:
+        try:
+            await channel.send(f"今天是**{song.name}**的 {song.anniv} 歲生日，生日快樂 :tada: :tada:！\n{song.url}")
+        except Exception as e:
+            print(f"Error in post_anniv: {e}")
 
     return
 
-@tasks.loop(minutes=5)
-async def scrape_tickets():
-    """Scrape tickets every 5 minutes"""
-    try:
-        print("🔍 Starting scheduled ticket scraping...")
-        scraper = TicketJamScraper()
-
-        # Scrape tickets from the configured URL
-        tickets = scraper.scrape_tickets(SCRAPE_URL)
-
-        if not tickets:
-            print("No tickets found during scraping")
-            return
+def save_scraped_tickets(db, tickets):
+    """Write a scrape's tickets to the database and delete the ones no longer listed
 
-        # Update database
-        new_count = 0
-        updated_count = 0
-        price_changes = []
-        current_ticket_ids = []
+    Returns (new_count, updated_count, deleted_count, price_changes)
+    """
+    new_count = 0
+    updated_count = 0
+    price_changes = []
+    current_ticket_ids = set()
 
-        for ticket in tickets:
-            is_new, action = scraper.db.insert_or_update_ticket(ticket)
-            current_ticket_ids.append(ticket.ticket_id)
+    # Write the whole scrape, and the removal of tickets no longer listed,
+    # in one transaction
+    with db.transaction():
+        results = db.insert_or_update_tickets(tickets)
+        for ticket, (is_new, action) in zip(tickets, results):
+            current_ticket_ids.add(ticket.ticket_id)
 
             if is_new:
                 new_count += 1
@@ -200,7 +222,26 @@ async def scrape_tickets():
             # If action is just "Updated last_seen", don't count as updated
 
         # Delete removed tickets (tickets that are no longer available)
-        deleted_count = scraper.db.delete_removed_tickets(current_ticket_ids)
+        deleted_count = db.delete_removed_tickets(current_ticket_ids)
+
+    return new_count, updated_count, deleted_count, price_changes
+
+@tasks.loop(minutes=5)
+async def scrape_tickets():
+    """Scrape tickets every 5 minutes"""
+    try:
+        print("🔍 Starting scheduled ticket scraping...")
+        scraper = get_scraper()
+
+        # Fetch and parse off the event loop
+        tickets = await asyncio.to_thread(scraper.scrape_tickets, SCRAPE_URL)
+
+        if not tickets:
+            print("No tickets found during scraping")
+            return
+
+        # Update database
+        new_count, updated_count, deleted_count, price_changes = save_scraped_tickets(scraper.db, tickets)
 
         print(f"✅ Scraping completed: New: {new_count}, Updated: {updated_count}, Deleted: {deleted_count}, Price changes: {len(price_changes)}")
 
@@ -218,79 +259,19 @@ async def before_anniv():
 async def before_scrape_tickets():
     await bot.wait_until_ready()
 
-async def post_unposted_tickets():
-    """Post all unposted tickets to Discord channel"""
-    try:
-        db = TicketDatabase()
-        unposted_tickets = db.get_unposted_tickets('active')
-
-        if not unposted_tickets:
-            return {"status": "success", "message": "No unposted tickets found", "count": 0}
-
-        channel = bot.get_channel(CHANNEL)
-        if not channel:
-            return {"status": "error", "message": f"Could not find channel with ID {CHANNEL}"}
-
-        posted_count = 0
-        ticket_ids_to_mark = []
-
-        for ticket in unposted_tickets:
-            try:
-                embed = format_ticket_for_discord(ticket)
-                await channel.send(embed=embed)
-                ticket_ids_to_mark.append(ticket['ticket_id'])
-                posted_count += 1
-
-                # Add small delay to avoid rate limiting
-                await asyncio.sleep(1)
-
-            except Exception as e:
-                print(f"Error posting ticket {ticket['ticket_id']}: {e}")
-                continue
-
-        # Mark all successfully posted tickets as posted
-        if ticket_ids_to_mark:
-            mark_tickets_as_posted(ticket_ids_to_mark)
-
-        return {
-            "status": "success",
-            "message": f"Posted {posted_count} tickets",
-            "count": posted_count,
-            "ticket_ids": ticket_ids_to_mark
-        }
-
-    except Exception as e:
-        return {"status": "error", "message": str(e)}
-
 async def manual_scrape():
     """Manual scraping triggered via Discord command"""
     try:
         print("🔍 Manual scraping triggered via Discord command...")
-        scraper = TicketJamScraper()
+        scraper = get_scraper()
 
-        tickets = scraper.scrape_tickets(SCRAPE_URL)
+        # Fetch off the event loop; with retries a slow fetch can take minutes
+        tickets = await asyncio.to_thread(scraper.scrape_tickets, SCRAPE_URL)
 
         if not tickets:
             return {"status": "success", "message": "No tickets found", "count": 0}
 
-        new_count = 0
-        updated_count = 0
-        price_changes = []
-        current_ticket_ids = []
-
-        for ticket in tickets:
-            is_new, action = scraper.db.insert_or_update_ticket(ticket)
-            current_ticket_ids.append(ticket.ticket_id)
-
-            if is_new:
-                new_count += 1
-            elif "Price changed" in action:
-                # Only count as updated if something actually changed (price change)
-                updated_count += 1
-                price_changes.append((ticket, action))
-            # If action is just "Updated last_seen", don't count as updated
-
-        deleted_count = scraper.db.delete_removed_tickets(current_ticket_ids)
+        new_count, updated_count, deleted_count, price_changes = save_scraped_tickets(scraper.db, tickets)
 
         return {
             "status": "success",
@@ -322,32 +303,38 @@ async def on_ready():
 
     print("🤖 Discord bot ready with automated ticket monitoring!")
 
+# Shoga's names, each one taking effect on its date
+NAME_ERAS = [
+    (date(2021, 4, 5), "新生姜ストリングス"),
+    (date(2022, 4, 5), "真・しょうがストリングス"),
+    (date(2022, 9, 1), "家系・しょうがストリングス"),
+    (date(2023, 4, 5), "SASUKE・しょうがストリングス"),
+    (date(2024, 4, 5), "パッド・パウエルしょうがストリングス"),
+    (date(2025, 4, 5), "アポ取りしょうがストリングス"),
+]
+NAME_ERA_DATES = [d for d, _ in NAME_ERAS]
+
+CHRONICAL_MSG = "我的貓生\n" + "".join(
+    f"{d} {'誕生，名字是' if i == 0 else '改名'}「**{n}**」\n" for i, (d, n) in enumerate(NAME_ERAS)
+)
+
 @bot.hybrid_command(name="myname", description="顯示生姜現在或在某個日期(d=YYYY-MM-DD)時的名字")
 async def name(ctx, d=None):
     if await unwilling_to_speak(ctx):
         return
         
-    msg = "我現在的名字是「**アポ取りしょうがストリングス**」"
+    msg = f"我現在的名字是「**{NAME_ERAS[-1][1]}**」"
     if d != None:
         try:
             d = date.fromisoformat(d)
         except ValueError:
             pass
         else:
-            if d < date(2021, 4, 5):
+            i = bisect_right(NAME_ERA_DATES, d)
+            if i == 0:
                 msg = f"我在{d}時還沒誕生"
-            elif date(2021, 4, 5) < d <= date(2022, 4, 5):
-                msg = f"我在{d}時的名字是「**新生姜ストリングス**」"
-            elif date(2022, 4, 5) < d <= date(2022, 9, 1):
-                msg = f"我在{d}時的名字是「**真・しょうがストリングス**」"
-            elif date(2022, 9, 1) < d <= date(2023, 4, 5):
-                msg = f"我在{d}時的名字是「**家系・しょうがストリングス**」"
-            elif date(2023, 4, 5) < d <= date(2024, 4, 5):
-                msg = f"我在{d}時的名字是「**SASUKE・しょうがストリングス**」"
-            elif date(2024, 4, 5) < d <= date(2025, 4, 5):
-                msg = f"我在{d}時的名字是「**パッド・パウエルしょうがストリングス**」"
-            elif date(2025, 4, 5) < d:
-                msg = f"我在{d}時的名字是「**アポ取りしょうがストリングス**」"
+            else:
+                msg = f"我在{d}時的名字是「**{NAME_ERAS[i - 1][1]}**」"
     await ctx.send(msg)
 
 @bot.hybrid_command(name="chronical", description="顯示生姜的生涯事紀")
@@ -355,14 +342,7 @@ async def chronical(ctx, d=None):
     if await unwilling_to_speak(ctx):
         return
 
-    msg = f"我的貓生\n"
-    msg += f"2021-04-05 誕生，名字是「**新生姜ストリングス**」\n"
-    msg += f"2022-04-05 改名「**真・しょうがストリングス**」\n"
-    msg += f"2022-09-01 改名「**家系・しょうがストリングス**」\n"
-    msg += f"2023-04-05 改名「**SASUKE・しょうがストリングス**」\n"
-    msg += f"2024-04-05 改名「**パッド・パウエルしょうがストリングス**」\n"
-    msg += f"2025-04-05 改名「**アポ取りしょうがストリングス**」\n"
-    await ctx.send(msg)
+    await ctx.send(CHRONICAL_MSG)
 
 @bot.hybrid_command(name="interval", description="列出日期[a, b)之間滿週年的歌曲，格式為YYYY-MM-DD且間隔不能大於365天")
 async def interval(ctx, a, b):
@@ -378,61 +358,48 @@ async def interval(ctx, a, b):
         msg = "日期格式錯誤或差距超過365天"
     else:
         songs = songs_in_range(a, b)
-        if not any(songs):
-            msg = "{a} ~ {b} 之間沒有即將滿週年的歌曲\n"
+        if not songs:
+            msg = f"{a} ~ {b} 之間沒有即將滿週年的歌曲\n"
         else:
             msg = f"{a} ~ {b} 之間滿週年的歌曲有\n"
             msg += songs_to_msg(songs)
     await ctx.send(msg)
 
+def upcoming_songs_msg(days, empty_msg, found_msg):
+    """Build the reply listing songs reaching their anniversary within the next `days` days"""
+    t = current_date()
+    songs = songs_in_range(t, t + timedelta(days=days))
+    if not songs:
+        return empty_msg
+    return found_msg + songs_to_msg(songs)
+
 @bot.hybrid_command(name="today", description="列出今天滿周年的歌曲")
 async def today(ctx):
     if await unwilling_to_speak(ctx):
         return
 
-    songs = songs_in_range(date.today(), date.today() + timedelta(days=1))
-    if not any(songs):
-        msg = "今天沒有滿週年的歌曲\n"
-    else:
-        msg = "今天滿週年的歌曲有\n"
-        msg += songs_to_msg(songs)
-    await ctx.send(msg)
+    await ctx.send(upcoming_songs_msg(1, "今天沒有滿週年的歌曲\n", "今天滿週年的歌曲有\n"))
 
 @bot.hybrid_command(name="week", description="列出未來一週將滿周年的歌曲")
 async def week(ctx):
     if await unwilling_to_speak(ctx):
         return
 
-    songs = songs_in_range(date.today(), date.today() + timedelta(days=7))
-    if not any(songs):
-        msg = "未來一週沒有滿週年的歌曲\n"
-    else:
-        msg = "未來一週即將滿週年的歌曲有\n"
-        msg += songs_to_msg(songs)
-    await ctx.send(msg)
+    await ctx.send(upcoming_songs_msg(7, "未來一週沒有滿週年的歌曲\n", "未來一週即將滿週年的歌曲有\n"))
 
 @bot.hybrid_command(name="month", description="列出未來一個月將滿周年的歌曲")
 async def month(ctx):
     if await unwilling_to_speak(ctx):
         return
 
-    songs = songs_in_range(date.today(), date.today() + timedelta(days=30))
-    if not any(songs):
-        msg = "未來一個月沒有即將滿週年的歌曲\n"
-    else:
-        msg = "未來一個月即將滿週年的歌曲有\n"
-        msg += songs_to_msg(songs)
-    await ctx.send(msg)
+    await ctx.send(upcoming_songs_msg(30, "未來一個月沒有即將滿週年的歌曲\n", "未來一個月即將滿週年的歌曲有\n"))
 
 @bot.hybrid_command(name="year", description="列出未來一年將滿周年的歌曲")
 async def year(ctx):
     if await unwilling_to_speak(ctx):
         return
 
-    songs = songs_in_range(date.today(), date.today() + timedelta(days=365))
-    msg = "未來一年即將滿週年的歌曲有\n"
-    msg += songs_to_msg(songs)
-    await ctx.send(msg)
+    await ctx.send(upcoming_songs_msg(365, "未來一年沒有即將滿週年的歌曲\n", "未來一年即將滿週年的歌曲有\n"))
 
 @bot.hybrid_command(name="next_n", description="列出未來n天將滿周年的歌曲（N<366）")
 async def next_n(ctx, n):
@@ -446,12 +413,7 @@ async def next_n(ctx, n):
     except ValueError:
         msg = "錯誤：n必須為小於 366 的整數"
     else:
-        songs = songs_in_range(date.today(), date.today() + timedelta(days=int(n)))
-        if not any(songs):
-            msg = f"未來{n}天沒有即將滿週年的歌曲\n"
-        else:
-            msg = f"未來{n}天即將滿週年的歌曲有\n"
-            msg += songs_to_msg(songs)
+        msg = upcoming_songs_msg(n, f"未來{n}天沒有即將滿週年的歌曲\n", f"未來{n}天即將滿週年的歌曲有\n")
     await ctx.send(msg)
 
 @bot.hybrid_command(name="poke", description="戳戳")
@@ -489,6 +451,9 @@ async def is_admin(ctx):
 @bot.hybrid_command(name="post_tickets", description="手動投稿未發布的票券 (僅限管理員)")
 async def cmd_post_tickets(ctx):
     """Manually post unposted tickets (Admin only)"""
+    # Acknowledge the interaction first; the database work can outlast the 3s deadline
+    await ctx.defer()
+
     if not await is_admin(ctx):
         await ctx.send("❌ 此指令僅限管理員使用")
         return
@@ -507,12 +472,15 @@ async def cmd_post_tickets(ctx):
 @bot.hybrid_command(name="ticket_status", description="查看未發布票券數量 (僅限管理員)")
 async def cmd_ticket_status(ctx):
     """Check current unposted ticket count (Admin only)"""
+    # Acknowledge the interaction first; the database work can outlast the 3s deadline
+    await ctx.defer()
+
     if not await is_admin(ctx):
         await ctx.send("❌ 此指令僅限管理員使用")
         return
 
     try:
-        db = TicketDatabase()
+        db = get_ticket_db()
         unposted_tickets = db.get_unposted_tickets('active')
         count = len(unposted_tickets)
 
@@ -526,6 +494,9 @@ async def cmd_ticket_status(ctx):
 @bot.hybrid_command(name="scrape_now", description="立即執行票券爬取 (僅限管理員)")
 async def cmd_scrape_now(ctx):
     """Manually trigger immediate ticket scraping (Admin only)"""
+    # Acknowledge the interaction first; the database work can outlast the 3s deadline
+    await ctx.defer()
+
     if not await is_admin(ctx):
         await ctx.send("❌ 此指令僅限管理員使用")
         return
@@ -534,11 +505,13 @@ async def cmd_scrape_now(ctx):
     result = await manual_scrape()
 
     if result["status"] == "success":
-        msg = f"✅ 爬取完成！\n"
-        msg += f"新票券: {result['new_tickets']}\n"
-        msg += f"更新票券: {result['updated_tickets']}\n"
-        msg += f"刪除票券: {result['deleted_tickets']}\n"
-        msg += f"價格變動: {result['price_changes']}"
+        msg = "\n".join([
+            "✅ 爬取完成！",
+            f"新票券: {result['new_tickets']}",
+            f"更新票券: {result['updated_tickets']}",
+            f"刪除票券: {result['deleted_tickets']}",
+            f"價格變動: {result['price_changes']}",
+        ])
         await ctx.send(msg)
     else:
         await ctx.send(f"❌ 錯誤: {result['message']}")
@@ -549,23 +522,44 @@ async def cmd_admin_status(ctx):
     is_user_admin = await is_admin(ctx)
 
     if is_user_admin:
-        msg = "✅ 您擁有票券管理權限\n\n"
-        msg += "📋 **可用的票券指令:**\n"
-        msg += "• `/post_tickets` - 手動投稿未發布的票券\n"
-        msg += "• `/ticket_status` - 查看未發布票券數量\n"
-        msg += "• `/scrape_now` - 立即執行票券爬取\n"
-        msg += "• `/admin_status` - 檢查管理員權限狀態"
+        msg = ("✅ 您擁有票券管理權限\n\n"
+               "📋 **可用的票券指令:**\n"
+               "• `/post_tickets` - 手動投稿未發布的票券\n"
+               "• `/ticket_status` - 查看未發布票券數量\n"
+               "• `/scrape_now` - 立即執行票券爬取\n"
+               "• `/admin_status` - 檢查管理員權限狀態")
     else:
         if ctx.guild is None:
-            msg = "❌ 票券管理指令不能在私訊中使用\n\n"
-            msg += "🔒 請在伺服器中使用這些指令"
+            msg = ("❌ 票券管理指令不能在私訊中使用\n\n"
+                   "🔒 請在伺服器中使用這些指令")
         else:
-            msg = "❌ 您沒有票券管理權限\n\n"
-            msg += "🔒 **權限說明:**\n"
-            msg += "票券相關指令僅限擁有伺服器管理員權限的用戶使用"
+            msg = ("❌ 您沒有票券管理權限\n\n"
+                   "🔒 **權限說明:**\n"
+                   "票券相關指令僅限擁有伺服器管理員權限的用戶使用")
 
     await ctx.send(msg)
 
+async def run_bot():
+    """bot.run's runner, so the event loop can be chosen"""
+    async with bot:
+        await bot.start(TOKEN)
+
 if __name__ == "__main__":
-    # Start Discord bot
-    bot.run(TOKEN)
+    # Use uvloop's faster event loop when it is installed (not available on
+    # Windows); passed as a loop factory since event loop policies are deprecated
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+
+    # Start Discord bot, set up the way bot.run would
+    discord.utils.setup_logging()
+    try:
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(run_bot())
+    except KeyboardInterrupt:
+        pass
+
+    if ticket_scraper is not None:
+        ticket_scraper.close()
@@ -1,4 +1,6 @@
 from datetime import date, timedelta
+from bisect import bisect_left
+from functools import lru_cache
 import random
 
 SONGS = {
@@ -45,11 +47,15 @@ SONGS = {
 }
 
 class Song:
+    __slots__ = ('date', 'name', 'en_name', 'mv', '_md')
+
     def __init__(self, d, name, en_name, mv):
         self.date = d
         self.name = name
         self.en_name = en_name
         self.mv = mv
+        # month and day packed into one int, ordered like (month, day)
+        self._md = d.month * 32 + d.day
 
     @property
     def year(self):
@@ -72,7 +78,7 @@ class Song:
     # later than the basis to the same year, so that every adjusted date is in
     # the next 365 days of the basis
     def adjusted_date(self, basis):
-        if (self.month < basis.month) or (self.month == basis.month and self.day < basis.day):
+        if self._md < basis.month * 32 + basis.day:
             return self.date.replace(year=basis.year+1)
         else:
             return self.date.replace(year=basis.year)
@@ -80,60 +86,75 @@ class Song:
     def __str__(self):
         return f"{self.date}\t{self.name}"
 
-random.seed()
-songs = []
+rng = random.Random()
+songs = [Song(date.fromisoformat(k), *v) for k, v in SONGS.items()]
 
-for k, v in SONGS.items():
-    date = date.fromisoformat(k)
-    songs.append(Song(date, *v))
+# Songs ordered by anniversary day, so the songs reaching their anniversary
+# within a window are one contiguous run of this list (wrapping at year end)
+songs_by_day = sorted(songs, key=lambda s: (s.month, s.day, s.year))
+song_days = [(s.month, s.day) for s in songs_by_day]
 
 class QueryResult(Song):
-    def __init__(self, d, name, en_name, mv, adj_date):
-        super().__init__(d, name, en_name, mv)
+    __slots__ = ('adj_date', 'anniv')
+
+    def __init__(self, song, adj_date):
+        self.date = song.date
+        self.name = song.name
+        self.en_name = song.en_name
+        self.mv = song.mv
+        self._md = song._md
         self.adj_date = adj_date
-        self.anniv = adj_date.year - d.year
-
-    @classmethod
-    def from_song(cls, song, adj_date):
-        return cls(song.date, song.name, song.en_name, song.mv, adj_date)
+        self.anniv = adj_date.year - song.year
 
     def __str__(self):
         return f"{self.date}\t{self.anniv}週年\t{self.name}"
 
+# The result only depends on the arguments, so repeated queries for the same
+# window are served from the cache. Returns a tuple so cached results can't be
+# mutated by callers.
+@lru_cache(maxsize=64)
 def songs_in_range(begin, end):
     if end - begin > timedelta(days=365):
-        return []
+        return ()
 
     anniv_songs = []
-    for song in songs:
+    start = bisect_left(song_days, (begin.month, begin.day))
+    for i in range(start, start + len(songs_by_day)):
+        song = songs_by_day[i % len(songs_by_day)]
         adj_date = song.adjusted_date(begin)
-        if begin <= adj_date < end:
-            anniv_songs.append(QueryResult.from_song(song, adj_date))
+        if adj_date >= end:
+            break
+        anniv_songs.append(QueryResult(song, adj_date))
+
+    # Walking songs_by_day from the window start already yields songs by
+    # adj_date, and by descending anniv within a day, so no sort is needed
+    return tuple(anniv_songs)
 
-    anniv_songs.sort(key=lambda x: (x.adj_date - date.today(), x.anniv*-1))
-    return anniv_songs
+RICKROLL = Song(date(2009, 10, 25), "Never Gonna Give You Up", "", "dQw4w9WgXcQ")
+HOTPOT = Song(date(2009, 10, 25), "【統神端火鍋】高畫質修復", "", "dMTy6C4UiQ4")
 
 def random_song():
-    if random.randint(0, 99) < 5:
-        if random.randint(0, 2) == 1:
-            return Song("2009-10-25", "Never Gonna Give You Up", "", "dQw4w9WgXcQ")
+    if rng.random() < 0.05:
+        if rng.random() < 1 / 3:
+            return RICKROLL
         else:
-            return Song("2009-10-25", "【統神端火鍋】高畫質修復", "", "dMTy6C4UiQ4")
-    return random.choice(songs)
+            return HOTPOT
+    return rng.choice(songs)
 
 def random_seat():
-    if random.randint(0, 100) < 5:
-        if (rand := random.randint(0, 3)) == 0:
+    if rng.random() < 0.05:
+        if (rand := rng.randint(0, 3)) == 0:
             return "你抽到的位子是保羅的大腿上"
         elif rand == 1:
             return "你落選了"
         else:
             return "你抽到了海軍陸戰隊！！"
-    level = random.randint(1, 3)
-    if random.randint(0, 99) < 5:
+    # One draw covers every level (3) x row (30) x number (60) combination
+    level, seat = divmod(rng.randrange(3 * 30 * 60), 30 * 60)
+    row, number = divmod(seat, 60)
+    level, row, number = level + 1, row + 1, number + 1
+    if rng.random() < 0.05:
         level = 7
 
-    row = random.randint(1, 30)
-    number = random.randint(1, 60)    
     return f"你抽到的位子是{level}階{row}列{number}番"
 
@@ -6,7 +6,7 @@ A comprehensive web scraper for TicketJam (https://ticketjam.jp/) that extracts
 ticket information and stores it in a SQLite database for tracking and monitoring.
 
 Features:
-- Web scraping with BeautifulSoup
+- Web scraping with BeautifulSoup (lxml parser)
 - SQLite database storage for ticket tracking
 - Duplicate detection and price change monitoring
 - Bot functionality for automated monitoring
@@ -17,7 +17,7 @@ Usage:
     python ticketjam.py bot [URL1] [URL2] ...       # Run bot once
     python ticketjam.py monitor [URL1] [URL2] ...   # Run continuous bot
     python ticketjam.py stats                       # Show database stats
-    python ticketjam.py dump [status]             # Export database to stdout
+    python ticketjam.py dump [status] [--pretty]  # Export database to stdout
     python ticketjam.py unposted [status]          # Show unposted tickets
     python ticketjam.py posted [ticket_id1] ...    # Mark tickets as posted
     python ticketjam.py clear                      # Clear all data from database
@@ -31,11 +31,50 @@ import time
 import sqlite3
 import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 import os
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
+from urllib.parse import urljoin
+from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional, Any
-from bs4 import BeautifulSoup
+from typing import List, Dict, Optional, Any, Iterable
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Relative ticket links are resolved against this
+BASE_URL = 'https://ticketjam.jp/'
+
+# A yen amount such as "12,000円" (the number and 円 may be split across
+# lines), group 1 is the number
+PRICE_PATTERN = re.compile(r'(\d{1,3}(?:,\d{3})*)\s*円')
+
+# Quantity and time tokens, used to rule out event name lines
+QUANTITY_PATTERN = re.compile(r'(\d+)\s*枚')
+TIME_PATTERN = re.compile(r'(\d{1,2}):(\d{2})')
+
+# Every per-line ticket field in one pass; m.lastgroup names the field
+TICKET_LINE_PATTERN = re.compile(
+    r'(?P<quantity>(?P<count>\d+)\s*枚)'
+    r'|(?P<date>(?P<year>\d{2,4})[/\-年](?P<month>\d{1,2})[/\-月](?P<day>\d{1,2}))'
+    r'|(?P<time>(?P<hour>\d{1,2}):(?P<minute>\d{2}))'
+    r'|(?P<days_remaining>残り\s*(?P<days>\d+)\s*日)'
+)
+
+# "2025/12/23(火) 19:00 東京 ガーデンシアター" or "2026/01/04 13:30 千葉 幕張メッセ"
+# -> location, venue (the day of week is optional)
+VENUE_PATTERN = re.compile(r'\d{4}/\d{1,2}/\d{1,2}(?:\([^)]+\))?\s+\d{1,2}:\d{2}\s+(\S+)\s+(.+)')
+
+# Deletes the separators and unit from a stored price string
+PRICE_STRIP = str.maketrans('', '', ',円')
+
+def parse_price(price: str) -> int:
+    """Parse a stored price such as "12,000円" into an int (raises ValueError if it isn't one)"""
+    return int(price.translate(PRICE_STRIP))
 
 @dataclass
 class TicketInfo:
@@ -83,14 +122,96 @@ class TicketInfo:
 
 class TicketDatabase:
     """Database manager for ticket tracking"""
+
+    # Applied to every connection. WAL lets readers run alongside the writer and
+    # only needs an fsync at checkpoints, which NORMAL syncing makes safe. The
+    # busy timeout comes from sqlite3.connect's own timeout (5s by default).
+    PRAGMAS = (
+        'PRAGMA journal_mode=WAL',
+        'PRAGMA synchronous=NORMAL',
+        'PRAGMA temp_store=MEMORY',
+        'PRAGMA mmap_size=268435456',
+        'PRAGMA cache_size=-20000',
+    )
     
+    # Run for every scraped ticket, kept as a constant so the same text hits
+    # the connection's prepared statement cache each time. On conflict, posted
+    # is cleared only when the price changed, so the ticket is re-posted; the
+    # price_history rows are written by triggers (see init_database).
+    UPSERT_TICKET_SQL = '''
+        INSERT INTO tickets (
+            ticket_id, title, event_name, date, time, venue, location, price,
+            quantity, seat_info, description, days_remaining, is_instant_buy, url,
+            first_seen, last_seen, status, posted
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+        ON CONFLICT (ticket_id) DO UPDATE SET
+            title = excluded.title, event_name = excluded.event_name, date = excluded.date,
+            time = excluded.time, venue = excluded.venue, location = excluded.location,
+            price = excluded.price, quantity = excluded.quantity, seat_info = excluded.seat_info,
+            description = excluded.description, days_remaining = excluded.days_remaining,
+            is_instant_buy = excluded.is_instant_buy, url = excluded.url,
+            last_seen = excluded.last_seen, status = excluded.status,
+            posted = CASE WHEN tickets.price IS NOT excluded.price THEN 0 ELSE tickets.posted END,
+            updated_at = CURRENT_TIMESTAMP
+    '''
+
     def __init__(self, db_path: str = "ticketjam.db"):
         self.db_path = db_path
+        self._lock = threading.RLock()  # Serializes transactions on the shared connection
+        self._conn = self._connect()
         self.init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the database with PRAGMAS applied"""
+        # Autocommit mode: transactions are opened explicitly by transaction().
+        # The connection may be used from worker threads, guarded by _lock.
+        conn = sqlite3.connect(self.db_path, isolation_level=None,
+                               check_same_thread=False, cached_statements=256)
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def close(self):
+        """Close the shared database connection"""
+        self._conn.close()
+
+    @contextmanager
+    def transaction(self, write: bool = True):
+        """
+        Run the enclosed block in a transaction on the shared connection
+
+        The transaction is committed when the block exits, or rolled back if
+        it raises (or the commit fails). A transaction opened inside another
+        one joins it, so the outer block decides when everything is committed.
+
+        Args:
+            write: Take the write lock up front (BEGIN IMMEDIATE), so a block
+                that reads and then writes waits out another process's writer
+                via the busy timeout instead of failing with SQLITE_BUSY when
+                it tries to upgrade. Pass False for read-only blocks.
+
+        Yields:
+            sqlite3.Connection: The shared connection
+        """
+        with self._lock:
+            if self._conn.in_transaction:
+                yield self._conn
+                return
+
+            self._conn.execute('BEGIN IMMEDIATE' if write else 'BEGIN')
+            try:
+                yield self._conn
+                self._conn.execute('COMMIT')
+            except BaseException:
+                # Also reached when COMMIT itself fails, which would otherwise
+                # leave the transaction open for every later call to join
+                if self._conn.in_transaction:
+                    self._conn.execute('ROLLBACK')
+                raise
+
     def init_database(self):
         """Initialize the database with required tables"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.transaction() as conn:
             cursor = conn.cursor()
             
             # Create tickets table
@@ -142,128 +263,124 @@ class TicketDatabase:
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_tickets_date ON tickets (date)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_tickets_status ON tickets (status)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_tickets_first_seen ON tickets (first_seen)')
+            # Covers price history lookups by ticket, already in recorded_at order
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_price_history_ticket ON price_history (ticket_id, recorded_at, price)')
+
+            # Record the first price of every ticket and every change after that
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS trg_ticket_first_price AFTER INSERT ON tickets
+                BEGIN
+                    INSERT INTO price_history (ticket_id, price) VALUES (NEW.ticket_id, NEW.price);
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS trg_ticket_price_change AFTER UPDATE OF price ON tickets
+                WHEN OLD.price IS NOT NEW.price
+                BEGIN
+                    INSERT INTO price_history (ticket_id, price) VALUES (NEW.ticket_id, NEW.price);
+                END
+            ''')
             
-            conn.commit()
 
     def insert_or_update_ticket(self, ticket: TicketInfo) -> tuple[bool, str]:
         """
         Insert new ticket or update existing one
         Returns: (is_new, action_taken)
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        return self.insert_or_update_tickets([ticket])[0]
 
-            # Check if ticket already exists
-            cursor.execute('SELECT ticket_id, price, status FROM tickets WHERE ticket_id = ?', (ticket.ticket_id,))
-            existing = cursor.fetchone()
+    def insert_or_update_tickets(self, tickets: List[TicketInfo]) -> List[tuple[bool, str]]:
+        """
+        Insert or update a batch of tickets in a single transaction
 
-            current_time = datetime.now().isoformat()
+        Each ticket is handled as insert_or_update_ticket would: new tickets
+        are inserted, existing ones refreshed, and a price change is recorded
+        in price_history and clears the posted flag so the ticket is re-posted.
 
-            if existing:
-                existing_id, existing_price, existing_status = existing
+        Args:
+            tickets: Tickets to store
 
-                # Update last_seen timestamp
-                ticket.last_seen = current_time
+        Returns:
+            List of (is_new, action_taken), one per ticket in the same order
+        """
+        if not tickets:
+            return []
 
-                # Check if price changed
-                price_changed = existing_price != ticket.price
-                if price_changed:
-                    # Record price change
-                    cursor.execute('''
-                        INSERT INTO price_history (ticket_id, price)
-                        VALUES (?, ?)
-                    ''', (ticket.ticket_id, ticket.price))
+        current_time = datetime.now().isoformat()
 
-                    action = f"Price changed from {existing_price} to {ticket.price}"
-                else:
-                    action = "Updated last_seen"
+        with self.transaction() as conn:
+            cursor = conn.cursor()
 
-                # Update the ticket
-                # If price changed, set posted to false to trigger re-posting
-                if price_changed:
-                    cursor.execute('''
-                        UPDATE tickets SET
-                            title = ?, event_name = ?, date = ?, time = ?, venue = ?, location = ?,
-                            price = ?, quantity = ?, seat_info = ?, description = ?, days_remaining = ?,
-                            is_instant_buy = ?, url = ?, last_seen = ?, status = ?, posted = 0,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE ticket_id = ?
-                    ''', (
-                        ticket.title, ticket.event_name, ticket.date, ticket.time, ticket.venue,
-                        ticket.location, ticket.price, ticket.quantity, ticket.seat_info,
-                        ticket.description, ticket.days_remaining, ticket.is_instant_buy,
-                        ticket.url, ticket.last_seen, ticket.status, ticket.ticket_id
-                    ))
-                else:
-                    cursor.execute('''
-                        UPDATE tickets SET
-                            title = ?, event_name = ?, date = ?, time = ?, venue = ?, location = ?,
-                            price = ?, quantity = ?, seat_info = ?, description = ?, days_remaining = ?,
-                            is_instant_buy = ?, url = ?, last_seen = ?, status = ?,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE ticket_id = ?
-                    ''', (
-                        ticket.title, ticket.event_name, ticket.date, ticket.time, ticket.venue,
-                        ticket.location, ticket.price, ticket.quantity, ticket.seat_info,
-                        ticket.description, ticket.days_remaining, ticket.is_instant_buy,
-                        ticket.url, ticket.last_seen, ticket.status, ticket.ticket_id
-                    ))
-
-                conn.commit()
-                return False, action
+            # Look up the stored prices of all incoming tickets at once; only
+            # needed to report what changed, the history is kept by triggers
+            self._stage_ticket_ids(cursor, (ticket.ticket_id for ticket in tickets))
+            cursor.execute('SELECT ticket_id, price FROM tickets JOIN staged_ticket_ids USING (ticket_id)')
+            stored_prices = dict(cursor.fetchall())
 
-            else:
-                # Insert new ticket
-                ticket.first_seen = current_time
+            results = []
+            for ticket in tickets:
                 ticket.last_seen = current_time
 
-                cursor.execute('''
-                    INSERT INTO tickets (
-                        ticket_id, title, event_name, date, time, venue, location, price,
-                        quantity, seat_info, description, days_remaining, is_instant_buy, url,
-                        first_seen, last_seen, status, posted
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    ticket.ticket_id, ticket.title, ticket.event_name, ticket.date, ticket.time,
-                    ticket.venue, ticket.location, ticket.price, ticket.quantity,
-                    ticket.seat_info, ticket.description, ticket.days_remaining,
-                    ticket.is_instant_buy, ticket.url, ticket.first_seen, ticket.last_seen, ticket.status, 0
-                ))
-
-                # Record initial price
-                cursor.execute('''
-                    INSERT INTO price_history (ticket_id, price)
-                    VALUES (?, ?)
-                ''', (ticket.ticket_id, ticket.price))
+                if ticket.ticket_id in stored_prices:
+                    existing_price = stored_prices[ticket.ticket_id]
+                    if existing_price != ticket.price:
+                        results.append((False, f"Price changed from {existing_price} to {ticket.price}"))
+                    else:
+                        results.append((False, "Updated last_seen"))
+                else:
+                    ticket.first_seen = current_time
+                    results.append((True, "New ticket added"))
+
+                # Later duplicates in the batch compare against this ticket
+                stored_prices[ticket.ticket_id] = ticket.price
+
+            # Insert new tickets and update existing ones in one pass. Price
+            # changes are appended to price_history by trg_ticket_price_change.
+            cursor.executemany(self.UPSERT_TICKET_SQL, [(
+                ticket.ticket_id, ticket.title, ticket.event_name, ticket.date, ticket.time,
+                ticket.venue, ticket.location, ticket.price, ticket.quantity,
+                ticket.seat_info, ticket.description, ticket.days_remaining,
+                ticket.is_instant_buy, ticket.url, ticket.first_seen, ticket.last_seen, ticket.status
+            ) for ticket in tickets])
+
+            return results
+
+    def _stage_ticket_ids(self, cursor: sqlite3.Cursor, ticket_ids: Iterable[str]):
+        """
+        Load ticket IDs into the temp table staged_ticket_ids, replacing its
+        previous contents, for queries to join against
 
-                conn.commit()
-                return True, "New ticket added"
+        Binding one parameter per ID in an IN (...) list can exceed SQLite's
+        variable limit on a large scrape; a keyed temp table has no limit.
+        The temp table is private to the connection, so this is allowed in a
+        read-only transaction as well.
+        """
+        cursor.execute('CREATE TEMP TABLE IF NOT EXISTS staged_ticket_ids (ticket_id TEXT PRIMARY KEY)')
+        cursor.execute('DELETE FROM staged_ticket_ids')
+        cursor.executemany('INSERT OR IGNORE INTO staged_ticket_ids VALUES (?)',
+                           [(ticket_id,) for ticket_id in ticket_ids])
 
-    def delete_removed_tickets(self, current_ticket_ids: List[str]):
+    def delete_removed_tickets(self, current_ticket_ids: Iterable[str]):
         """Delete tickets not in current scrape (they're no longer available)"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.transaction() as conn:
             cursor = conn.cursor()
 
-            if current_ticket_ids:
-                placeholders = ','.join(['?' for _ in current_ticket_ids])
-                cursor.execute(f'''
-                    DELETE FROM tickets
-                    WHERE status = 'active' AND ticket_id NOT IN ({placeholders})
-                ''', current_ticket_ids)
-            else:
-                # If no current tickets, delete all active tickets
-                cursor.execute('''
-                    DELETE FROM tickets
-                    WHERE status = 'active'
-                ''')
+            # If there are no current tickets, all active tickets are deleted.
+            self._stage_ticket_ids(cursor, current_ticket_ids)
 
-            deleted_count = cursor.rowcount
-            conn.commit()
-            return deleted_count
+            # NOT EXISTS probes the temp table's key per row, and unlike NOT IN
+            # isn't defeated by a NULL ID
+            cursor.execute('''
+                DELETE FROM tickets
+                WHERE status = 'active' AND NOT EXISTS (
+                    SELECT 1 FROM staged_ticket_ids WHERE staged_ticket_ids.ticket_id = tickets.ticket_id
+                )
+            ''')
+            return cursor.rowcount
 
     def get_statistics(self) -> Dict:
         """Get database statistics"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.transaction(write=False) as conn:
             cursor = conn.cursor()
 
             stats = {}
@@ -284,65 +401,86 @@ class TicketDatabase:
 
             return stats
 
-    def dump_tickets_to_json(self, status_filter: str = None) -> Dict:
+    def dump_tickets_to_json(self, status_filter: str = None, pretty: bool = False) -> Dict:
         """
         Export all tickets from database to JSON format and output to stdout
 
+        Tickets are written to stdout one at a time as they are read, so only
+        the exported tickets' price history is held in memory, not the whole
+        export.
+
         Args:
             status_filter: Filter by status ('active', 'sold') or None for all
+            pretty: Indent the output by 2 spaces instead of writing compact JSON
 
         Returns:
-            Dictionary containing all ticket data
+            Dictionary containing the export metadata (everything but the tickets)
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self.transaction(write=False) as conn:
             cursor = conn.cursor()
 
             # Build query based on filter
             if status_filter:
-                query = 'SELECT * FROM tickets WHERE status = ? ORDER BY first_seen DESC'
-                cursor.execute(query, (status_filter,))
+                where, params = 'WHERE status = ?', (status_filter,)
             else:
-                query = 'SELECT * FROM tickets ORDER BY first_seen DESC'
-                cursor.execute(query)
-
-            # Get column names
-            columns = [description[0] for description in cursor.description]
-
-            # Fetch all tickets
-            tickets_data = []
-            for row in cursor.fetchall():
-                ticket_dict = dict(zip(columns, row))
-                tickets_data.append(ticket_dict)
-
-            # Get price history for each ticket
-            for ticket in tickets_data:
-                cursor.execute('''
-                    SELECT price, recorded_at
-                    FROM price_history
-                    WHERE ticket_id = ?
-                    ORDER BY recorded_at
-                ''', (ticket['ticket_id'],))
-
-                price_history = []
-                for price, recorded_at in cursor.fetchall():
-                    price_history.append({
-                        'price': price,
-                        'recorded_at': recorded_at
-                    })
-
-                ticket['price_history'] = price_history
+                where, params = '', ()
+
+            cursor.execute(f'SELECT COUNT(*) FROM tickets {where}', params)
+            total_tickets = cursor.fetchone()[0]
+
+            # Get the price history of every exported ticket in one query. The
+            # history outlives deleted tickets, so only read the exported ones'
+            histories = {}
+            cursor.execute(f'''
+                SELECT ph.ticket_id, ph.price, ph.recorded_at
+                FROM price_history ph JOIN tickets USING (ticket_id)
+                {where}
+                ORDER BY ph.recorded_at, ph.id
+            ''', params)
+            for ticket_id, price, recorded_at in cursor:
+                histories.setdefault(ticket_id, []).append({
+                    'price': price,
+                    'recorded_at': recorded_at
+                })
 
             # Create export data structure
             export_data = {
                 'export_timestamp': datetime.now().isoformat(),
-                'total_tickets': len(tickets_data),
+                'total_tickets': total_tickets,
                 'status_filter': status_filter,
                 'database_path': self.db_path,
-                'tickets': tickets_data
             }
 
-            # Output JSON to stdout
-            print(json.dumps(export_data, ensure_ascii=False, indent=2))
+            # Output JSON to stdout, laid out as json.dumps would lay out
+            # export_data with a 'tickets' list appended
+            out = sys.stdout
+            if pretty:
+                header = json.dumps(export_data, ensure_ascii=False, indent=2)
+                out.write(header[:-len('\n}')] + ',\n  "tickets": [')
+                first_separator, separator = '\n    ', ',\n    '
+                footer = '\n  ]\n}\n' if total_tickets else ']\n}\n'
+            else:
+                header = json.dumps(export_data, ensure_ascii=False, separators=(',', ':'))
+                out.write(header[:-len('}')] + ',"tickets":[')
+                first_separator, separator = '', ','
+                footer = ']}\n'
+
+            cursor.execute(f'SELECT * FROM tickets {where} ORDER BY first_seen DESC', params)
+            columns = [description[0] for description in cursor.description]
+
+            next_separator = first_separator
+            while rows := cursor.fetchmany(1000):
+                for row in rows:
+                    ticket = dict(zip(columns, row))
+                    ticket['price_history'] = histories.get(ticket['ticket_id'], [])
+                    if pretty:
+                        ticket_json = json.dumps(ticket, ensure_ascii=False, indent=2).replace('\n', '\n    ')
+                    else:
+                        ticket_json = json.dumps(ticket, ensure_ascii=False, separators=(',', ':'))
+                    out.write(next_separator + ticket_json)
+                    next_separator = separator
+
+            out.write(footer)
 
             return export_data
 
@@ -354,13 +492,12 @@ class TicketDatabase:
             bool: True if successful, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.transaction() as conn:
                 cursor = conn.cursor()
 
                 # Clear all data from tables
                 cursor.execute("DELETE FROM price_history")
                 cursor.execute("DELETE FROM tickets")
-                conn.commit()
 
                 return True
 
@@ -376,9 +513,16 @@ class TicketDatabase:
             bool: True if successful, False otherwise
         """
         try:
+            # Release the shared connection before removing its files
+            self.close()
+
             # Delete the database file
             if os.path.exists(self.db_path):
                 os.remove(self.db_path)
+                # Along with its WAL files, if a connection left them behind
+                for suffix in ('-wal', '-shm'):
+                    if os.path.exists(self.db_path + suffix):
+                        os.remove(self.db_path + suffix)
                 print(f"Database file '{self.db_path}' deleted successfully", file=sys.stderr)
             else:
                 print(f"Database file '{self.db_path}' does not exist", file=sys.stderr)
@@ -400,8 +544,11 @@ class TicketDatabase:
             List of ticket dictionaries that need to be posted
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.transaction(write=False) as conn:
                 cursor = conn.cursor()
+                # Rows by column name: the column order differs between fresh
+                # databases and ones that got 'posted' through ALTER TABLE
+                cursor.row_factory = sqlite3.Row
 
                 # Build query based on status filter
                 if status_filter:
@@ -424,28 +571,9 @@ class TicketDatabase:
 
                 tickets = []
                 for row in cursor.fetchall():
-                    ticket_dict = {
-                        'ticket_id': row[0],
-                        'title': row[1],
-                        'event_name': row[2],
-                        'date': row[3],
-                        'time': row[4],
-                        'venue': row[5],
-                        'location': row[6],
-                        'price': row[7],
-                        'quantity': row[8],
-                        'seat_info': row[9],
-                        'description': row[10],
-                        'days_remaining': row[11],
-                        'is_instant_buy': bool(row[12]),
-                        'url': row[13],
-                        'first_seen': row[14],
-                        'last_seen': row[15],
-                        'status': row[16],
-                        'created_at': row[17],
-                        'updated_at': row[18],
-                        'posted': bool(row[19])
-                    }
+                    ticket_dict = dict(row)
+                    ticket_dict['is_instant_buy'] = bool(ticket_dict['is_instant_buy'])
+                    ticket_dict['posted'] = bool(ticket_dict['posted'])
                     tickets.append(ticket_dict)
 
                 return tickets
@@ -465,13 +593,13 @@ class TicketDatabase:
             List of price history entries with price and recorded_at
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.transaction(write=False) as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT price, recorded_at
                     FROM price_history
                     WHERE ticket_id = ?
-                    ORDER BY recorded_at
+                    ORDER BY recorded_at, id
                 ''', (ticket_id,))
 
                 price_history = []
@@ -508,8 +636,8 @@ class TicketDatabase:
 
         # Parse prices for comparison
         try:
-            current_val = int(current_price.replace(',', '').replace('円', ''))
-            previous_val = int(previous_price.replace(',', '').replace('円', ''))
+            current_val = parse_price(current_price)
+            previous_val = parse_price(previous_price)
 
             if current_val > previous_val:
                 # Price increased
@@ -534,14 +662,55 @@ class TicketDatabase:
             Enhanced ticket dictionary with price_info and color_hint
         """
         price_history = self.get_price_history(ticket_dict['ticket_id'])
+        return self._enhance_ticket(ticket_dict, price_history)
+
+    def get_tickets_with_price_info_bulk(self, ticket_dicts: List[Dict]) -> Dict[str, Dict]:
+        """
+        Enhance several ticket dictionaries with price change information,
+        loading all their price histories in a single query
+
+        Args:
+            ticket_dicts: Basic ticket dictionaries
+
+        Returns:
+            Dictionary mapping ticket_id to its enhanced ticket dictionary
+        """
+        histories = {ticket['ticket_id']: [] for ticket in ticket_dicts}
+
+        if histories:
+            try:
+                with self.transaction(write=False) as conn:
+                    cursor = conn.cursor()
+                    self._stage_ticket_ids(cursor, histories)
+                    cursor.execute('''
+                        SELECT ticket_id, price, recorded_at
+                        FROM price_history JOIN staged_ticket_ids USING (ticket_id)
+                        ORDER BY recorded_at, id
+                    ''')
+
+                    for ticket_id, price, recorded_at in cursor.fetchall():
+                        histories[ticket_id].append({
+                            'price': price,
+                            'recorded_at': recorded_at
+                        })
+            except Exception as e:
+                print(f"Error getting price histories: {e}", file=sys.stderr)
+
+        return {
+            ticket['ticket_id']: self._enhance_ticket(ticket, histories[ticket['ticket_id']])
+            for ticket in ticket_dicts
+        }
+
+    def _enhance_ticket(self, ticket_dict: Dict, price_history: List[Dict]) -> Dict:
+        """Attach price_info, color_hint and price_history to a copy of ticket_dict"""
         price_info = self.format_price_change_info(ticket_dict['price'], price_history)
 
         # Determine color hint based on price change
         color_hint = 'default'  # green
         if len(price_history) > 1:
             try:
-                current_val = int(ticket_dict['price'].replace(',', '').replace('円', ''))
-                previous_val = int(price_history[-2]['price'].replace(',', '').replace('円', ''))
+                current_val = parse_price(ticket_dict['price'])
+                previous_val = parse_price(price_history[-2]['price'])
                 if current_val > previous_val:
                     color_hint = 'increase'  # red
                 elif current_val < previous_val:
@@ -568,19 +737,18 @@ class TicketDatabase:
             bool: True if successful, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.transaction() as conn:
                 cursor = conn.cursor()
 
                 # Update posted status for specified tickets
-                placeholders = ','.join(['?' for _ in ticket_ids])
-                cursor.execute(f'''
+                self._stage_ticket_ids(cursor, ticket_ids)
+                cursor.execute('''
                     UPDATE tickets
                     SET posted = 1, updated_at = CURRENT_TIMESTAMP
-                    WHERE ticket_id IN ({placeholders})
-                ''', ticket_ids)
+                    WHERE ticket_id IN (SELECT ticket_id FROM staged_ticket_ids)
+                ''')
 
                 updated_count = cursor.rowcount
-                conn.commit()
 
                 print(f"Marked {updated_count} tickets as posted", file=sys.stderr)
                 return True
@@ -609,7 +777,7 @@ class TicketDatabase:
             bool: True if database is empty, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.transaction(write=False) as conn:
                 cursor = conn.cursor()
                 cursor.execute('SELECT COUNT(*) FROM tickets')
                 count = cursor.fetchone()[0]
@@ -621,89 +789,160 @@ class TicketDatabase:
 class TicketJamScraper:
     """Scraper for TicketJam website with database integration"""
 
+    # Only build a tree for <body>; <head> (scripts, styles, meta) is never
+    # searched. The whole body is kept so the fallback container search can
+    # still walk up from any price element to the <body> boundary.
+    PARSE_ONLY = SoupStrainer('body')
+
     def __init__(self, db_path: str = "ticketjam.db"):
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'ja,en-US;q=0.7,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate',
+            # gzip and deflate, plus br/zstd when brotli/zstandard are installed
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
+        # One keep-alive pool for the site, large enough for scrape_urls'
+        # threads, retrying transient failures with backoff
+        retry = Retry(total=3, backoff_factor=0.5,
+                      status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=frozenset({'GET'}))
+        self.session.mount(BASE_URL, HTTPAdapter(pool_connections=1, pool_maxsize=8, max_retries=retry))
         self.db = TicketDatabase(db_path)
+        # Worker processes for scrape_urls, started on first use and kept for
+        # later scrapes, since starting them costs more than parsing a page
+        self._parse_pool = None
+
+    def close(self):
+        """Close the HTTP session, the parsing processes and the database connection"""
+        self.session.close()
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown()
+            self._parse_pool = None
+        self.db.close()
 
     def scrape_tickets(self, url: str) -> List[TicketInfo]:
         """Scrape tickets from TicketJam URL using direct HTML element extraction"""
+        page = self._fetch_page(url)
+        if page is None:
+            return []
+        return self._parse_tickets(*page)
+
+    def _fetch_page(self, url: str) -> Optional[tuple[bytes, Optional[str]]]:
+        """
+        Download a TicketJam page
+
+        Returns:
+            (content, encoding), where encoding is None unless the server
+            declared one, or None if the request failed
+        """
         try:
             print(f"Fetching URL: {url}")
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"Error fetching URL {url}: {e}")
+            return None
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-            tickets = []
-
-
-
-            # Strategy 1: Find ticket cards/containers by common patterns
-            ticket_containers = []
-
-            # Look for elements that contain price information (including li elements for TicketJam)
-            for element in soup.find_all(['div', 'article', 'section', 'li']):
-                if self._contains_ticket_data(element):
-                    ticket_containers.append(element)
-
-            # Strategy 2: If no containers found, look for elements containing price patterns
-            if not ticket_containers:
-                # Find all elements that contain price patterns in their text
-                all_elements = soup.find_all(['div', 'span', 'p', 'article', 'section', 'li'])
-                price_elements = []
+        # Only trust the response encoding if the server declared one;
+        # requests falls back to ISO-8859-1 for text/* otherwise
+        content_type = response.headers.get('content-type', '').lower()
+        encoding = response.encoding if 'charset' in content_type else None
+        return response.content, encoding
+
+    def _parse_tickets(self, content: bytes, encoding: Optional[str] = None) -> List[TicketInfo]:
+        """Extract the tickets listed on a downloaded page"""
+        soup = BeautifulSoup(content, 'lxml',
+                             parse_only=self.PARSE_ONLY,
+                             from_encoding=encoding)
+        tickets = []
+
+
+
+        # Strategy 1: Find ticket cards/containers by common patterns
+        ticket_containers = []
+
+        # Look for elements that contain price information (including li elements for TicketJam)
+        for element in self._elements_containing(soup, ['div', 'article', 'section', 'li'], '円'):
+            if self._contains_ticket_data(element):
+                ticket_containers.append(element)
+
+        # Strategy 2: If no containers found, look for elements containing price patterns
+        if not ticket_containers:
+            # Find all elements that contain price patterns in their text
+            all_elements = self._elements_containing(soup, ['div', 'span', 'p', 'article', 'section', 'li'], '円')
+            price_elements = []
+
+            for elem in all_elements:
+                elem_text = elem.get_text()
+                if PRICE_PATTERN.search(elem_text):
+                    price_elements.append(elem)
+
+            # Price elements share ancestors, so remember each verdict
+            # instead of re-reading the same subtree's text on every walk
+            is_container = {}
+
+            for price_elem in price_elements:
+                container = price_elem
+                # Walk up the DOM to find a reasonable container
+                for level in range(5):  # Max 5 levels up
+                    if container and container.name != 'body':
+                        if id(container) not in is_container:
+                            is_container[id(container)] = self._contains_ticket_data(container)
+                        if is_container[id(container)]:
+                            ticket_containers.append(container)
+                            break
+                        container = container.parent
+                    else:
+                        break
 
-                for elem in all_elements:
-                    elem_text = elem.get_text()
-                    if re.search(r'\d{1,3}(?:,\d{3})*[\s\n]*円', elem_text):
-                        price_elements.append(elem)
+        # Extract ticket data from each container
+        for container in ticket_containers:
+            try:
+                ticket = self._extract_ticket_from_element(container)
+                if ticket and self._is_valid_ticket(ticket):
+                    tickets.append(ticket)
+            except Exception as e:
+                continue
 
-                for price_elem in price_elements:
-                    container = price_elem
-                    # Walk up the DOM to find a reasonable container
-                    for level in range(5):  # Max 5 levels up
-                        if container and container.name != 'body':
-                            if self._contains_ticket_data(container):
-                                ticket_containers.append(container)
-                                break
-                            container = container.parent
-                        else:
-                            break
+        # Remove duplicates based on ticket_id, keeping the first occurrence
+        by_id = {}
+        for ticket in tickets:
+            by_id.setdefault(ticket.ticket_id, ticket)
+        unique_tickets = list(by_id.values())
 
-            # Extract ticket data from each container
-            for container in ticket_containers:
-                try:
-                    ticket = self._extract_ticket_from_element(container)
-                    if ticket and self._is_valid_ticket(ticket):
-                        tickets.append(ticket)
-                except Exception as e:
-                    continue
+        print(f"Found {len(unique_tickets)} unique tickets")
+        return unique_tickets
 
-            # Remove duplicates based on ticket_id
-            unique_tickets = []
-            seen_ids = set()
-            id_counts = {}
+    def _elements_containing(self, soup, names: List[str], char: str) -> List:
+        """
+        Find elements with one of the given tag names whose text contains char
 
-            for ticket in tickets:
-                # Count how many times each ID appears
-                id_counts[ticket.ticket_id] = id_counts.get(ticket.ticket_id, 0) + 1
+        Equivalent to filtering soup.find_all(names) on char in get_text(),
+        but only the ancestors of matching strings are considered, so the
+        text of every element isn't rebuilt just to be rejected.
 
-                if ticket.ticket_id not in seen_ids:
-                    unique_tickets.append(ticket)
-                    seen_ids.add(ticket.ticket_id)
+        Args:
+            soup: Parsed document
+            names: Tag names to return
+            char: A single character the element text must contain
 
-            print(f"Found {len(unique_tickets)} unique tickets")
-            return unique_tickets
+        Returns:
+            Matching elements in document order
+        """
+        # A single character can't be split across strings, so an element's
+        # text contains it iff one of its descendant strings does
+        candidates = set()
+        for string in soup.find_all(string=lambda s: char in s):
+            for parent in string.parents:
+                if id(parent) in candidates:
+                    break
+                candidates.add(id(parent))
 
-        except requests.RequestException as e:
-            print(f"Error fetching URL {url}: {e}")
-            return []
+        return [element for element in soup.find_all(names) if id(element) in candidates]
 
     def _contains_ticket_data(self, element) -> bool:
         """Check if element contains ticket data without text matching"""
@@ -712,47 +951,44 @@ class TicketJamScraper:
 
         text = element.get_text()
 
-        # Must have price information (this is universal)
-        has_price = bool(re.search(r'\d{1,3}(?:,\d{3})*[\s\n]*円', text))
+        # Cheapest checks first; each one short-circuits the rest
 
         # Should be reasonably sized (not too small, not too large)
         text_length = len(text.strip())
-        reasonable_size = 50 < text_length < 5000  # Increased upper limit to catch more containers
+        if not 50 < text_length < 5000:  # Increased upper limit to catch more containers
+            return False
 
-        # Should have some structure (multiple lines or sections)
-        has_structure = len(text.split('\n')) > 3 or len(text.split()) > 10
+        # Must have price information (this is universal)
+        if not PRICE_PATTERN.search(text):
+            return False
 
-        return has_price and reasonable_size and has_structure
+        # Should have some structure (multiple lines or sections)
+        return text.count('\n') >= 3 or len(text.split()) > 10
 
     def _extract_ticket_from_element(self, element) -> Optional[TicketInfo]:
         """Extract ticket information directly from HTML element"""
         try:
+            # Get all text content
+            full_text = element.get_text(separator='\n', strip=True)
+
+            # Extract price from full text (handles multi-line prices). It's
+            # the one required field, so don't bother with the rest without it
+            price_match = PRICE_PATTERN.search(full_text)
+            if not price_match:
+                return None
+
             ticket = TicketInfo()
+            ticket.price = price_match.group(1) + '円'
 
             # Extract individual ticket URL
             # Check if the element itself is a link
             if element.name == 'a' and element.get('href'):
-                href = element.get('href')
-                if href.startswith('/'):
-                    ticket.url = f"https://ticketjam.jp{href}"
-                elif href.startswith('http'):
-                    ticket.url = href
-                else:
-                    ticket.url = f"https://ticketjam.jp/{href}"
+                ticket.url = urljoin(BASE_URL, element.get('href'))
             else:
                 # Look for parent link element
-                parent = element.parent
-                while parent and parent.name != 'body':
-                    if parent.name == 'a' and parent.get('href'):
-                        href = parent.get('href')
-                        if href.startswith('/'):
-                            ticket.url = f"https://ticketjam.jp{href}"
-                        elif href.startswith('http'):
-                            ticket.url = href
-                        else:
-                            ticket.url = f"https://ticketjam.jp/{href}"
-                        break
-                    parent = parent.parent
+                parent_link = element.find_parent('a', href=True)
+                if parent_link and parent_link.get('href'):
+                    ticket.url = urljoin(BASE_URL, parent_link.get('href'))
 
                 # If no parent link found, look for child links
                 if not ticket.url:
@@ -760,106 +996,66 @@ class TicketJamScraper:
                     for link in ticket_links:
                         href = link.get('href')
                         if href and ('/tickets/' in href or '/ticket/' in href):
-                            if href.startswith('/'):
-                                ticket.url = f"https://ticketjam.jp{href}"
-                            elif href.startswith('http'):
-                                ticket.url = href
-                            else:
-                                ticket.url = f"https://ticketjam.jp/{href}"
+                            ticket.url = urljoin(BASE_URL, href)
                             break
 
-            # Get all text content
-            full_text = element.get_text(separator='\n', strip=True)
-            lines = [line.strip() for line in full_text.split('\n') if line.strip()]
-
-
-
-            # Extract price from full text (handles multi-line prices)
-            price_patterns = [
-                r'(\d{1,3}(?:,\d{3})*)[\s\n]*円(?:/枚)?',  # With optional /枚
-                r'(\d{1,3}(?:,\d{3})*)[\s\n]+円',          # With whitespace
-                r'(\d{1,3}(?:,\d{3})*)\s*円',              # Simple format
-            ]
-
-            for pattern in price_patterns:
-                price_match = re.search(pattern, full_text)
-                if price_match and not ticket.price:
-                    ticket.price = price_match.group(1) + '円'
-                    break
-
-            # Extract other patterns from lines
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-
-                # Extract quantity (universal pattern)
-                quantity_match = re.search(r'(\d+)\s*枚', line)
-                if quantity_match and not ticket.quantity:
-                    ticket.quantity = quantity_match.group(1) + '枚'
-
-                # Extract date (universal pattern)
-                date_match = re.search(r'(\d{2,4})[/\-年](\d{1,2})[/\-月](\d{1,2})', line)
-                if date_match and not ticket.date:
-                    year, month, day = date_match.groups()
-                    if len(year) == 2:
-                        year = '20' + year
-                    ticket.date = f"{year}/{month.zfill(2)}/{day.zfill(2)}"
-
-                # Extract time (universal pattern)
-                time_match = re.search(r'(\d{1,2}):(\d{2})', line)
-                if time_match and not ticket.time:
-                    ticket.time = f"{time_match.group(1)}:{time_match.group(2)}"
-
-                # Extract remaining days
-                days_match = re.search(r'残り\s*(\d+)\s*日', line)
-                if days_match and not ticket.days_remaining:
-                    ticket.days_remaining = f"残り{days_match.group(1)}日"
-
-
+            # Non-empty text lines
+            lines = [stripped for line in full_text.split('\n') if (stripped := line.strip())]
+
+            # Extract every field in a single pass over the lines
+            for index, line in enumerate(lines):
+                # Extract quantity, date, time and remaining days in one scan
+                for match in TICKET_LINE_PATTERN.finditer(line):
+                    field = match.lastgroup
+                    if field == 'quantity':
+                        if not ticket.quantity:
+                            ticket.quantity = match['count'] + '枚'
+                    elif field == 'date':
+                        if not ticket.date:
+                            year, month, day = match.group('year', 'month', 'day')
+                            if len(year) == 2:
+                                year = '20' + year
+                            ticket.date = f"{year}/{month.zfill(2)}/{day.zfill(2)}"
+                    elif field == 'time':
+                        if not ticket.time:
+                            ticket.time = f"{match['hour']}:{match['minute']}"
+                    elif not ticket.days_remaining:
+                        ticket.days_remaining = f"残り{match['days']}日"
 
                 # Check for instant buy
                 if '即決' in line:
                     ticket.is_instant_buy = True
 
-            # Extract event name (first substantial line that's not price/date/time)
-            for line in lines[:5]:  # Check first few lines
-                if (len(line) > 10 and
-                    not re.search(r'\d{1,3}(?:,\d{3})*\s*円', line) and
-                    not re.search(r'\d{1,2}:\d{2}', line) and
-                    not re.search(r'\d+\s*枚', line) and
-                    not ticket.event_name):
+                # Extract event name (first substantial line among the first
+                # few that's not price/date/time). Each pattern needs its marker
+                # character, so a substring test rules most lines in or out
+                # before any regex runs
+                if (index < 5 and
+                    not ticket.event_name and
+                    len(line) > 10 and
+                    not ('円' in line and PRICE_PATTERN.search(line)) and
+                    not (':' in line and TIME_PATTERN.search(line)) and
+                    not ('枚' in line and QUANTITY_PATTERN.search(line))):
                     ticket.event_name = line
-                    break
+
+                # Extract venue and location from the first date/time line
+                # matching: date[(day)] time location venue
+                if not ticket.venue:
+                    venue_location_match = VENUE_PATTERN.search(line)
+                    if venue_location_match:
+                        ticket.location = venue_location_match.group(1).strip()
+                        ticket.venue = venue_location_match.group(2).strip()
 
             # Set title as event name
             ticket.title = ticket.event_name
 
-            # Extract venue and location from date/time lines
-            for line in lines:
-                # Look for the specific pattern: date(day) time location venue
-                # Example: "2025/12/23(火) 19:00 東京 ガーデンシアター"
-                venue_location_match = re.search(r'\d{4}/\d{1,2}/\d{1,2}\([^)]+\)\s+\d{1,2}:\d{2}\s+([^\s]+)\s+(.+)', line)
-                if venue_location_match:
-                    ticket.location = venue_location_match.group(1).strip()
-                    ticket.venue = venue_location_match.group(2).strip()
-                    break
-
-                # Alternative pattern without day of week
-                # Example: "2026/01/04 13:30 千葉 幕張メッセ"
-                venue_location_match2 = re.search(r'\d{4}/\d{1,2}/\d{1,2}\s+\d{1,2}:\d{2}\s+([^\s]+)\s+(.+)', line)
-                if venue_location_match2:
-                    ticket.location = venue_location_match2.group(1).strip()
-                    ticket.venue = venue_location_match2.group(2).strip()
-                    break
-
             # Store full description (first 500 chars)
             ticket.description = full_text[:500] if full_text else ""
 
             # Generate unique ticket ID after all fields are populated
             ticket.generate_ticket_id()
 
-            return ticket if ticket.price else None
+            return ticket
 
         except Exception as e:
             print(f"Error extracting ticket: {e}")
@@ -869,14 +1065,71 @@ class TicketJamScraper:
         """Validate that ticket has minimum required data"""
         return bool(ticket.price and (ticket.event_name or ticket.description))
 
-    def scrape_and_update_database(self, url: str) -> Dict[str, Any]:
+    def scrape_urls(self, urls: List[str], max_workers: int = 4) -> Dict[str, List[TicketInfo]]:
+        """
+        Scrape several URLs concurrently
+
+        The downloads are network-bound, so a few threads sharing the session's
+        connection pool overlap their waits (the pool is kept small to stay
+        polite to the site). Parsing is CPU-bound, so when there are several
+        pages they are parsed in separate processes, which are kept until
+        close() so later calls don't pay for starting them again.
+
+        Args:
+            urls: TicketJam URLs to scrape
+            max_workers: Maximum number of requests in flight at once
+
+        Returns:
+            Dictionary mapping each URL to its scraped tickets ([] on error)
+        """
+        results = {url: [] for url in urls}
+
+        pages = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as executor:
+            futures = {url: executor.submit(self._fetch_page, url) for url in urls}
+            for url, future in futures.items():
+                try:
+                    page = future.result()
+                except Exception as e:
+                    print(f"Error scraping {url}: {e}")
+                    continue
+                if page is not None:
+                    pages[url] = page
+
+        if len(pages) == 1:
+            [(url, page)] = pages.items()
+            results[url] = self._parse_tickets(*page)
+        elif pages:
+            if self._parse_pool is None:
+                self._parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+            futures = {url: self._parse_pool.submit(parse_tickets_page, *page) for url, page in pages.items()}
+            for url, future in futures.items():
+                try:
+                    results[url] = future.result()
+                except Exception as e:
+                    print(f"Error scraping {url}: {e}")
+                    if isinstance(e, BrokenProcessPool) and self._parse_pool is not None:
+                        # A worker died; start a fresh pool on the next call
+                        self._parse_pool.shutdown(wait=False)
+                        self._parse_pool = None
+
+        return results
+
+    def scrape_and_update_database(self, url: str, tickets: Optional[List[TicketInfo]] = None,
+                                   now: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Scrape tickets and update database, returning summary of changes
+
+        Args:
+            url: TicketJam URL
+            tickets: Tickets already scraped from url, or None to scrape it now
+            now: Timestamp for the summary, or None to use the current time
         """
         print(f"Scraping and updating database from: {url}")
 
         # Scrape current tickets
-        tickets = self.scrape_tickets(url)
+        if tickets is None:
+            tickets = self.scrape_tickets(url)
 
         if not tickets:
             return {
@@ -894,28 +1147,27 @@ class TicketJamScraper:
         new_tickets = []
         price_changes = []
 
-        current_ticket_ids = []
+        # Upsert the whole scrape and prune in one transaction
+        with self.db.transaction():
+            results = self.db.insert_or_update_tickets(tickets)
 
-        for ticket in tickets:
-            is_new, action = self.db.insert_or_update_ticket(ticket)
-            current_ticket_ids.append(ticket.ticket_id)
-
-            if is_new:
-                new_count += 1
-                new_tickets.append(ticket)
-            elif "Price changed" in action:
-                # Only count as updated if something actually changed (price change)
-                updated_count += 1
-                price_changes.append((ticket, action))
-            # If action is just "Updated last_seen", don't count as updated
+            for ticket, (is_new, action) in zip(tickets, results):
+                if is_new:
+                    new_count += 1
+                    new_tickets.append(ticket)
+                elif "Price changed" in action:
+                    # Only count as updated if something actually changed (price change)
+                    updated_count += 1
+                    price_changes.append((ticket, action))
+                # If action is just "Updated last_seen", don't count as updated
 
-        # Delete missing tickets (they're no longer available)
-        removed_count = self.db.delete_removed_tickets(current_ticket_ids)
+            # Delete missing tickets (they're no longer available)
+            removed_count = self.db.delete_removed_tickets({ticket.ticket_id for ticket in tickets})
 
         # Prepare summary
         summary = {
             'success': True,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': (now or datetime.now()).isoformat(),
             'total_scraped': len(tickets),
             'new_tickets': new_count,
             'updated_tickets': updated_count,
@@ -933,20 +1185,36 @@ class TicketJamScraper:
 
         return summary
 
+def parse_tickets_page(content: bytes, encoding: Optional[str] = None) -> List[TicketInfo]:
+    """
+    Extract the tickets listed on a downloaded TicketJam page
+
+    Module-level so it can run in a worker process. The parsing methods don't
+    use the scraper's session or database, so a bare instance is enough and
+    nothing unpicklable crosses the process boundary.
+    """
+    return TicketJamScraper.__new__(TicketJamScraper)._parse_tickets(content, encoding)
+
 def create_ticket_bot(urls: List[str], db_path: str = "ticketjam.db"):
     """Create a ticket monitoring bot"""
     scraper = TicketJamScraper(db_path)
 
     def run_bot_check():
         """Run a single bot check cycle"""
-        print(f"\n=== Bot Check at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ===")
+        # One timestamp for the whole cycle
+        now = datetime.now()
+        print(f"\n=== Bot Check at {now.strftime('%Y-%m-%d %H:%M:%S')} ===")
 
         total_new = 0
         total_price_changes = 0
 
+        # Fetch every URL up front, concurrently; the database updates below
+        # stay sequential
+        scraped = scraper.scrape_urls(urls)
+
         for url in urls:
             try:
-                summary = scraper.scrape_and_update_database(url)
+                summary = scraper.scrape_and_update_database(url, scraped[url], now)
 
                 if summary['success']:
                     total_new += summary['new_tickets']
@@ -963,8 +1231,6 @@ def create_ticket_bot(urls: List[str], db_path: str = "ticketjam.db"):
                         for ticket in summary['new_ticket_details']:
                             print(f"    - {ticket['event']} | {ticket['date']} | {ticket['price']} | {ticket['venue']}")
 
-                time.sleep(2)  # Be respectful between requests
-
             except Exception as e:
                 print(f"Error processing {url}: {e}")
 
@@ -986,15 +1252,31 @@ def run_continuous_bot(urls: List[str], db_path: str = "ticketjam.db", check_int
     print("Press Ctrl+C to stop")
 
     try:
+        # Checks start every check_interval seconds rather than
+        # check_interval after the previous one finished, so the time each
+        # check takes doesn't make the schedule drift
+        next_check = time.monotonic()
         while True:
             bot_check()
-            print(f"Sleeping for {check_interval} seconds...")
-            time.sleep(check_interval)
+            next_check += check_interval
+            delay = next_check - time.monotonic()
+            if delay < 0:
+                # The check overran its slot; start the next one now instead
+                # of running back-to-back checks to catch up
+                next_check -= delay
+                delay = 0
+            print(f"Sleeping for {delay:.0f} seconds...")
+            time.sleep(delay)
     except KeyboardInterrupt:
         print("\nBot stopped by user")
     except Exception as e:
         print(f"Bot error: {e}")
 
+@lru_cache(maxsize=8)
+def _get_db(db_path: str) -> TicketDatabase:
+    """Shared TicketDatabase (and connection) per path for the module-level helpers"""
+    return TicketDatabase(db_path)
+
 def get_bot_notifications(db_path: str = "ticketjam.db", since_minutes: int = 60) -> Dict[str, List]:
     """
     Get notifications for new tickets and price changes
@@ -1006,20 +1288,20 @@ def get_bot_notifications(db_path: str = "ticketjam.db", since_minutes: int = 60
     Returns:
         Dictionary with new tickets and price changes
     """
-    db = TicketDatabase(db_path)
-    since_time = datetime.now().replace(minute=max(0, datetime.now().minute - since_minutes)).isoformat()
+    db = _get_db(db_path)
+    since_time = (datetime.now() - timedelta(minutes=since_minutes)).isoformat()
 
     # Get new tickets
-    with sqlite3.connect(db_path) as conn:
+    with db.transaction(write=False) as conn:
         cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
         cursor.execute('''
             SELECT * FROM tickets
             WHERE first_seen > ? AND status = 'active'
             ORDER BY first_seen DESC
         ''', (since_time,))
 
-        columns = [description[0] for description in cursor.description]
-        new_tickets = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        new_tickets = [dict(row) for row in cursor]
 
     # Get price changes (simplified for now)
     price_changes = []
@@ -1037,18 +1319,19 @@ def scrape_ticketjam_url(url: str) -> List[TicketInfo]:
     return tickets
 
 
-def dump_database_to_json(status_filter: str = None) -> Dict:
+def dump_database_to_json(status_filter: str = None, pretty: bool = False) -> Dict:
     """
     Convenience function to export database to JSON and output to stdout
 
     Args:
         status_filter: Filter by status ('active', 'sold') or None for all
+        pretty: Indent the output instead of writing compact JSON
 
     Returns:
-        Dictionary containing all ticket data
+        Dictionary containing the export metadata
     """
-    db = TicketDatabase()
-    return db.dump_tickets_to_json(status_filter)
+    db = _get_db("ticketjam.db")
+    return db.dump_tickets_to_json(status_filter, pretty)
 
 
 def clear_database() -> bool:
@@ -1058,7 +1341,7 @@ def clear_database() -> bool:
     Returns:
         bool: True if successful, False otherwise
     """
-    db = TicketDatabase()
+    db = _get_db("ticketjam.db")
     return db.clear_database()
 
 
@@ -1069,7 +1352,9 @@ def delete_database() -> bool:
     Returns:
         bool: True if successful, False otherwise
     """
-    db = TicketDatabase()
+    db = _get_db("ticketjam.db")
+    # The connection is closed along with the file, so don't hand it out again
+    _get_db.cache_clear()
     return db.delete_database()
 
 
@@ -1083,7 +1368,7 @@ def get_unposted_tickets(status_filter: str = None) -> List[Dict]:
     Returns:
         List of ticket dictionaries that need to be posted
     """
-    db = TicketDatabase()
+    db = _get_db("ticketjam.db")
     return db.get_unposted_tickets(status_filter)
 
 
@@ -1097,7 +1382,7 @@ def mark_tickets_as_posted(ticket_ids: List[str]) -> bool:
     Returns:
         bool: True if successful, False otherwise
     """
-    db = TicketDatabase()
+    db = _get_db("ticketjam.db")
     return db.mark_tickets_as_posted(ticket_ids)
 
 
@@ -1111,7 +1396,7 @@ def mark_ticket_as_posted(ticket_id: str) -> bool:
     Returns:
         bool: True if successful, False otherwise
     """
-    db = TicketDatabase()
+    db = _get_db("ticketjam.db")
     return db.mark_ticket_as_posted(ticket_id)
 
 
@@ -1125,7 +1410,7 @@ def main():
         print("  python ticketjam.py bot [URL1] [URL2] ...       # Run bot once")
         print("  python ticketjam.py monitor [URL1] [URL2] ...   # Run continuous bot")
         print("  python ticketjam.py stats                       # Show database stats")
-        print("  python ticketjam.py dump [status]             # Export database to stdout")
+        print("  python ticketjam.py dump [status] [--pretty]  # Export database to stdout")
         print("  python ticketjam.py unposted [status]          # Show unposted tickets")
         print("  python ticketjam.py posted [ticket_id1] ...    # Mark tickets as posted")
         print("  python ticketjam.py clear                      # Clear all data from database")
@@ -1139,13 +1424,14 @@ def main():
         default_url = "https://ticketjam.jp/tickets/zuttomayonakade-iinoni?sort_query%5BisSellable%5D=true"
         url = sys.argv[2] if len(sys.argv) > 2 else default_url
 
+        # One scraper, and its database connection, for the whole command
+        scraper = TicketJamScraper()
+
         # Check if database is empty to determine behavior
-        db = TicketDatabase()
-        is_empty = db.is_database_empty()
+        is_empty = scraper.db.is_database_empty()
 
         if is_empty:
             # Database is empty - first run: scrape and store
-            scraper = TicketJamScraper()
             summary = scraper.scrape_and_update_database(url)
 
             print(f"\nFirst scrape completed - tickets stored in database:")
@@ -1157,14 +1443,13 @@ def main():
             # Also display sample tickets for user feedback
             if summary['new_tickets'] > 0:
                 print(f"\nSample of {min(5, summary['new_tickets'])} tickets added:")
-                tickets = scrape_ticketjam_url(url)
+                tickets = scraper.scrape_tickets(url)
                 for i, ticket in enumerate(tickets[:5], 1):
                     print(f"  {i}. {ticket.title} - {ticket.price} ({ticket.quantity})")
                 if len(tickets) > 5:
                     print(f"  ... and {len(tickets) - 5} more tickets")
         else:
             # Database has data - update mode
-            scraper = TicketJamScraper()
             summary = scraper.scrape_and_update_database(url)
 
             print(f"\nScrape and update completed:")
@@ -1192,7 +1477,7 @@ def main():
 
     elif mode == "stats":
         # Show database statistics
-        db = TicketDatabase()
+        db = _get_db("ticketjam.db")
         stats = db.get_statistics()
 
         print("=== Database Statistics ===")
@@ -1202,8 +1487,11 @@ def main():
             print(f"  {event}: {count}")
 
     elif mode == "dump":
-        # Export database to JSON (stdout only)
-        status_filter = sys.argv[2] if len(sys.argv) > 2 else None
+        # Export database to JSON (stdout only), compact unless --pretty
+        args = sys.argv[2:]
+        pretty = '--pretty' in args
+        args = [arg for arg in args if arg != '--pretty']
+        status_filter = args[0] if args else None
 
         # Validate status filter
         valid_statuses = ['active', 'sold']
@@ -1212,12 +1500,12 @@ def main():
             print(f"Valid options: {', '.join(valid_statuses)} or leave empty for all", file=sys.stderr)
             return
 
-        db = TicketDatabase()
-        export_data = db.dump_tickets_to_json(status_filter)
+        db = _get_db("ticketjam.db")
+        export_data = db.dump_tickets_to_json(status_filter, pretty)
 
     elif mode == "clear":
         # Clear all data from database
-        db = TicketDatabase()
+        db = _get_db("ticketjam.db")
         if db.clear_database():
             print("Database cleared successfully")
         else:
@@ -1225,8 +1513,7 @@ def main():
 
     elif mode == "delete":
         # Delete database file
-        db = TicketDatabase()
-        if db.delete_database():
+        if delete_database():
             print("Database deleted successfully")
         else:
             print("Failed to delete database")
@@ -1235,7 +1522,7 @@ def main():
         # Show unposted tickets
         status_filter = sys.argv[2] if len(sys.argv) > 2 else None
 
-        db = TicketDatabase()
+        db = _get_db("ticketjam.db")
         unposted_tickets = db.get_unposted_tickets(status_filter)
 
         if not unposted_tickets:
@@ -1261,7 +1548,7 @@ def main():
 
         ticket_ids = sys.argv[2:]
 
-        db = TicketDatabase()
+        db = _get_db("ticketjam.db")
         if db.mark_tickets_as_posted(ticket_ids):
             print(f"Successfully marked {len(ticket_ids)} tickets as posted")
         else: